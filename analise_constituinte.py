@@ -7,29 +7,117 @@ Data: outubro/2025
 
 import pandas as pd 
 import numpy as np # para operações que envolvem números
+import matplotlib
+matplotlib.use('Agg') # backend sem janela: o script só gera arquivos (PDF e, opcionalmente, PNG)
 import matplotlib.pyplot as plt # para criar visualizações mais elaboradas
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_pdf import PdfPages
 import seaborn as sns # para criar visualizações pré-definidas
-from collections import Counter
-import re # busca e substituição de expressões regulares
 import os # manipulação do diretório local
+import sys # leitura dos argumentos de linha de comando
+import re # busca e substituição de expressões regulares
+from concurrent.futures import ProcessPoolExecutor # contagem de palavras em paralelo
 
 # Configurações para melhor visualização no VSCode - parâmetros de visualização
 plt.rcParams['figure.figsize'] = (12, 8)
 plt.rcParams['font.size'] = 12
+DPI_GRAFICOS = 150 # resolução dos PNGs (--png); o tempo de gravação cresce com os pixels
 sns.set_style("whitegrid")
 
-print("🚀 INICIANDO ANÁLISE DOS DADOS DA CONSTITUINTE...\n")
+# Figura reaproveitada pelos gráficos de um único eixo (evita recriar figura e canvas)
+_FIG = Figure(figsize=(12, 6))
+
+# Todos os gráficos vão para um único PDF, uma página por gráfico
+ARQUIVO_PDF = 'analise_constituinte.pdf'
+
+# Arquivos de entrada - o parquet é um cache gerado a partir do CSV na primeira execução
+ARQUIVO_CSV = 'dados_constituinte.csv'
+ARQUIVO_PARQUET = 'dados_constituinte.parquet'
+
+# Colunas categóricas (poucos valores distintos, repetidos em muitas linhas)
+COLUNAS_CATEGORICAS = ['SEXO', 'UF', 'FAIXA ETÁRIA', 'INSTRUCAO', 'ESTADO CIVIL']
+
+# Colunas do perfil demográfico, contadas juntas em analise_demografica e resumo_final
+COLUNAS_DEMOGRAFICAS = ['SEXO', 'FAIXA ETÁRIA', 'INSTRUCAO', 'ESTADO CIVIL']
+
+# Ordem natural das faixas etárias (usada como ordem das categorias)
+ORDEM_FAIXA = ['15 A 19 ANOS', '20 A 24 ANOS', '25 A 29 ANOS', '30 A 39 ANOS',
+               '40 A 49 ANOS', '50 A 59 ANOS', 'ACIMA DE 59 ANOS', 'NÃO INFORMADO']
+
+# Linhas lidas por vez no modo --streaming (limita o pico de memória)
+TAMANHO_CHUNK = 500_000
+
+# Palavras com 4 ou mais letras (incluindo acentuadas), compiladas uma única vez
+TOKEN_RE = re.compile(r'\b[a-záéíóúâêîôûãõç]{4,}\b')
+
+# Stop words em português
+STOP_WORDS = frozenset({
+    'que', 'com', 'para', 'uma', 'mais', 'como', 'sobre', 'seus', 'este', 'esta',
+    'ser', 'seja', 'são', 'mas', 'muito', 'nosso', 'nossa', 'pelos', 'pelas',
+    'essa', 'esse', 'isso', 'aquele', 'aquela', 'entre', 'através', 'quando'
+})
+
+# Apenas as colunas usadas nas análises são carregadas
+COLUNAS_USADAS = COLUNAS_CATEGORICAS + ['DATA', 'SUGESTAO.TEXTO']
+TIPOS_COLUNAS = {coluna: 'category' for coluna in COLUNAS_CATEGORICAS}
+TIPOS_COLUNAS['SUGESTAO.TEXTO'] = 'string'
+
+def cache_valido():
+    """Indica se o parquet existe e é mais recente que o CSV"""
+    if not os.path.exists(ARQUIVO_PARQUET):
+        return False
+    if not os.path.exists(ARQUIVO_CSV):
+        return True
+    return os.path.getmtime(ARQUIVO_PARQUET) >= os.path.getmtime(ARQUIVO_CSV)
+
+def salvar_cache(df):
+    """Grava o dataset em parquet para acelerar as próximas execuções"""
+    try:
+        df.to_parquet(ARQUIVO_PARQUET, compression='zstd')
+        print(f"💾 Cache salvo em '{ARQUIVO_PARQUET}'")
+    except Exception as e:
+        # Sem pyarrow/fastparquet instalado o script continua funcionando, só sem cache
+        print(f"⚠️ Não foi possível salvar o cache parquet: {e}")
+
+def ordem_faixas(rotulos):
+    """Ordem das faixas etárias: ORDEM_FAIXA, com rótulos inesperados antes de 'NÃO INFORMADO'"""
+    extras = sorted(set(rotulos) - set(ORDEM_FAIXA))
+    return ORDEM_FAIXA[:-1] + extras + ORDEM_FAIXA[-1:]
+
+def ordenar_faixa_etaria(df):
+    """Converte a faixa etária em categoria ordenada, sem descartar rótulos fora de ORDEM_FAIXA"""
+    faixa = df['FAIXA ETÁRIA'].astype(object)
+    df['FAIXA ETÁRIA'] = pd.Categorical(faixa, categories=ordem_faixas(faixa.dropna().unique()),
+                                        ordered=True)
+    return df
 
 def carregar_dados():
     """Carrega e prepara o dataset"""
     try:
+        # Usa o cache parquet quando disponível (evita reprocessar o CSV)
+        if cache_valido():
+            try:
+                df = pd.read_parquet(ARQUIVO_PARQUET, columns=COLUNAS_USADAS)
+                print(f"✅ Dataset carregado do cache '{ARQUIVO_PARQUET}'!")
+                print(f"📊 Total de registros: {len(df):,}")
+                print(f"📈 Total de colunas: {len(df.columns)}")
+                return df
+            except Exception as e:
+                print(f"⚠️ Falha ao ler o cache parquet, usando o CSV: {e}")
+        
         # Verifica se o arquivo existe
-        if not os.path.exists('dados_constituinte.csv'):
-            print("❌ Arquivo 'dados_constituinte.csv' não encontrado!")
+        if not os.path.exists(ARQUIVO_CSV):
+            print(f"❌ Arquivo '{ARQUIVO_CSV}' não encontrado!")
             print("📁 Certifique-se de que o arquivo está na mesma pasta do script")
             return None
         
-        df = pd.read_csv('dados_constituinte.csv', delimiter=';', encoding='latin-1', na_values=['NA', ''])
+        df = pd.read_csv(ARQUIVO_CSV, delimiter=';', encoding='latin-1', na_values=['NA', ''],
+                         usecols=COLUNAS_USADAS, dtype=TIPOS_COLUNAS,
+                         parse_dates=['DATA'], dayfirst=True)
+        # Datas inválidas impedem a conversão automática; nesse caso viram NaT
+        if not pd.api.types.is_datetime64_any_dtype(df['DATA']):
+            df['DATA'] = pd.to_datetime(df['DATA'], dayfirst=True, errors='coerce')
+        salvar_cache(df)
         print(f"✅ Dataset carregado com sucesso!")
         print(f"📊 Total de registros: {len(df):,}")
         print(f"📈 Total de colunas: {len(df.columns)}")
@@ -39,30 +127,90 @@ def carregar_dados():
         print(f"❌ Erro ao carregar dados: {e}")
         return None
 
+def preencher_nao_informado(serie):
+    """Substitui valores faltantes por 'NÃO INFORMADO', inclusive em colunas categóricas"""
+    if isinstance(serie.dtype, pd.CategoricalDtype) and 'NÃO INFORMADO' not in serie.cat.categories:
+        serie = serie.cat.add_categories(['NÃO INFORMADO'])
+    return serie.fillna('NÃO INFORMADO')
+
+def preparar(df):
+    """Preenche uma única vez os faltantes das colunas categóricas, logo após a carga"""
+    df = ordenar_faixa_etaria(df)
+    for coluna in COLUNAS_CATEGORICAS:
+        df[coluna] = preencher_nao_informado(df[coluna])
+    return df
+
+def contagens_demograficas(df):
+    """Conta os valores de todas as colunas demográficas (já preparadas) de uma vez"""
+    contagens = {}
+    for coluna in COLUNAS_DEMOGRAFICAS:
+        # Sem ordenação: quem precisa dos maiores usa nlargest (seleção parcial)
+        contagem = df[coluna].value_counts(sort=False)
+        if coluna == 'FAIXA ETÁRIA':
+            # Categoria ordenada: contagem já sai na ordem das faixas, com zeros
+            contagens[coluna] = contagem
+            continue
+        # Colunas categóricas também listam categorias sem ocorrências
+        contagens[coluna] = contagem[contagem > 0]
+    return contagens
+
+def contar_palavras(textos):
+    """Conta as palavras (sem stop words) de uma série de textos"""
+    palavras = textos.str.lower().str.findall(TOKEN_RE).explode().dropna()
+    # Cada palavra vira um código inteiro; a contagem é um bincount sobre os códigos
+    codigos, vocabulario = pd.factorize(palavras)
+    frequencias = np.bincount(codigos, minlength=len(vocabulario))
+    # Stop words são verificadas uma vez por palavra distinta, não por ocorrência
+    frequencias[vocabulario.isin(STOP_WORDS)] = 0
+    contagem = pd.Series(frequencias, index=vocabulario)
+    return contagem[contagem > 0]
+
+def nova_figura(largura, altura):
+    """Limpa a figura compartilhada, ajusta o tamanho e devolve um eixo novo"""
+    _FIG.clf()
+    _FIG.set_size_inches(largura, altura)
+    return _FIG.add_subplot(111)
+
+def salvar_grafico(fig, arquivo, pdf, png=False):
+    """Grava o gráfico como uma página do PDF e, se pedido, também em PNG"""
+    pdf.savefig(fig, bbox_inches='tight')
+    if png:
+        fig.savefig(arquivo, dpi=DPI_GRAFICOS, bbox_inches='tight', metadata={})
+
 def analise_preliminar(df):
-    """Análise inicial dos dados"""
+    """Análise inicial dos dados (feita antes de preparar, com os valores originais)"""
+    relatorio_preliminar(df.head(), df.isnull().sum(), len(df))
+
+def relatorio_preliminar(amostra, missing, total):
+    """Mostra as primeiras linhas, as colunas e os valores faltantes"""
     print("\n" + "="*50)
     print("📋 ANÁLISE PRELIMINAR")
     print("_"*50)
     
     # Primeiras linhas
     print("\n🔍 Primeiras 5 linhas:")
-    print(df.head())
+    print(amostra)
     
     # Informações das colunas
     print("\n📝 Colunas disponíveis:")
-    for i, coluna in enumerate(df.columns, 1):
+    for i, coluna in enumerate(amostra.columns, 1):
         print(f"  {i:2d}. {coluna}")
     
     # Valores missing
     print("\n📉 Valores faltantes:")
-    missing = df.isnull().sum()
     for coluna, faltantes in missing[missing > 0].items():
-        percentual = (faltantes / len(df)) * 100
+        percentual = (faltantes / total) * 100
         print(f"  • {coluna}: {faltantes} ({percentual:.1f}%)")
 
-def analise_demografica(df):
-    """Análise do perfil demográfico dos participantes"""
+def analise_demografica(df, pdf, png=False):
+    """Análise do perfil demográfico dos participantes (devolve as contagens por coluna)"""
+    # Uma única passada sobre as quatro colunas demográficas
+    contagens = contagens_demograficas(df)
+    grafico_demografico(contagens, len(df), pdf, png)
+    return contagens
+
+def grafico_demografico(contagens, total, pdf, png=False):
+    """Gera o gráfico e as estatísticas do perfil demográfico a partir das contagens"""
     print("\n" + "="*50)
     print("👥 ANÁLISE DEMOGRÁFICA")
     print("="*50)
@@ -72,197 +220,190 @@ def analise_demografica(df):
     fig.suptitle('PERFIL DEMOGRÁFICO DOS PARTICIPANTES', fontsize=16, fontweight='bold')
     
     # 1. Distribuição por Sexo
-    df['SEXO'] = df['SEXO'].fillna('NÃO INFORMADO')
-    sexo_counts = df['SEXO'].value_counts()
+    sexo_counts = contagens['SEXO'].sort_values(ascending=False)
     colors_sexo = ["#331212", '#4ECDC4', '#95A5A6']  # Vermelho, Verde, Cinza
     axes[0,0].pie(sexo_counts.values, labels=sexo_counts.index, autopct='%1.1f%%', 
                   colors=colors_sexo, startangle=90)
     axes[0,0].set_title('Distribuição por Sexo', fontweight='bold')
     
     # 2. Distribuição por Faixa Etária
-    df['FAIXA ETÁRIA'] = df['FAIXA ETÁRIA'].fillna('NÃO INFORMADO')
-    faixa_etaria = df['FAIXA ETÁRIA'].value_counts()
-    # Reordenar para melhor visualização
-    ordem_faixa = ['15 A 19 ANOS', '20 A 24 ANOS', '25 A 29 ANOS', '30 A 39 ANOS', 
-                   '40 A 49 ANOS', '50 A 59 ANOS', 'ACIMA DE 59 ANOS', 'NÃO INFORMADO']
-    faixa_etaria = faixa_etaria.reindex(ordem_faixa, fill_value=0)
+    faixa_etaria = contagens['FAIXA ETÁRIA']
     
     bars = axes[0,1].bar(faixa_etaria.index, faixa_etaria.values, color='skyblue', alpha=0.8)
     axes[0,1].set_title('Distribuição por Faixa Etária', fontweight='bold')
     axes[0,1].tick_params(axis='x', rotation=45)
     
-    # Adicionar valores nas barras
-    for bar in bars:
-        height = bar.get_height()
-        if height > 0:
-            axes[0,1].text(bar.get_x() + bar.get_width()/2., height,
-                         f'{int(height)}', ha='center', va='bottom')
+    # Adicionar valores nas barras (faixas sem ocorrências ficam sem rótulo)
+    axes[0,1].bar_label(bars, labels=[f'{int(v)}' if v > 0 else '' for v in faixa_etaria.values])
     
     # 3. Distribuição por Escolaridade
-    df['INSTRUCAO'] = df['INSTRUCAO'].fillna('NÃO INFORMADO')
-    instrucao = df['INSTRUCAO'].value_counts().head(8)
+    instrucao = contagens['INSTRUCAO'].nlargest(8)
     bars = axes[1,0].barh(instrucao.index, instrucao.values, color='lightgreen', alpha=0.8)
     axes[1,0].set_title('Distribuição por Escolaridade', fontweight='bold')
     
     # Adicionar valores nas barras horizontais
-    for bar in bars:
-        width = bar.get_width()
-        axes[1,0].text(width, bar.get_y() + bar.get_height()/2.,
-                     f' {int(width)}', ha='left', va='center')
+    axes[1,0].bar_label(bars, fmt='%d', padding=3)
     
     # 4. Distribuição por Estado Civil
-    df['ESTADO CIVIL'] = df['ESTADO CIVIL'].fillna('NÃO INFORMADO')
-    estado_civil = df['ESTADO CIVIL'].value_counts().head(6)
+    estado_civil = contagens['ESTADO CIVIL'].nlargest(6)
     colors_estado = ['#FF9FF3', '#F368E0', '#FF9F43', '#10AC84', '#54A0FF', '#5F27CD']
     axes[1,1].pie(estado_civil.values, labels=estado_civil.index, autopct='%1.1f%%',
                   colors=colors_estado, startangle=90)
     axes[1,1].set_title('Distribuição por Estado Civil', fontweight='bold')
     
-    plt.tight_layout()
-    plt.savefig('perfil_demografico.png', dpi=300, bbox_inches='tight')
-    plt.show()
+    fig.tight_layout()
+    salvar_grafico(fig, 'perfil_demografico.png', pdf, png)
+    plt.close(fig)
     
     # Estatísticas detalhadas
     print(f"\n📊 ESTATÍSTICAS DETALHADAS:")
-    print(f"• Homens: {len(df[df['SEXO'] == 'MASCULINO']):,} ({(len(df[df['SEXO'] == 'MASCULINO'])/len(df))*100:.1f}%)")
-    print(f"• Mulheres: {len(df[df['SEXO'] == 'FEMININO']):,} ({(len(df[df['SEXO'] == 'FEMININO'])/len(df))*100:.1f}%)")
-    print(f"• Sexo não informado: {len(df[df['SEXO'] == 'NÃO INFORMADO']):,}")
+    # Reaproveita a contagem já feita para o gráfico, sem varrer a coluna de novo
+    homens = sexo_counts.get('MASCULINO', 0)
+    mulheres = sexo_counts.get('FEMININO', 0)
+    nao_informado = sexo_counts.get('NÃO INFORMADO', 0)
+    print(f"• Homens: {homens:,} ({(homens/total)*100:.1f}%)")
+    print(f"• Mulheres: {mulheres:,} ({(mulheres/total)*100:.1f}%)")
+    print(f"• Sexo não informado: {nao_informado:,}")
+
+def analise_geografica(df, pdf, png=False):
+    """Análise da distribuição geográfica (devolve a contagem por UF)"""
+    uf_counts = df['UF'].value_counts(sort=False)
+    # A categoria 'NÃO INFORMADO' existe mesmo sem faltantes; descarta as UFs zeradas
+    uf_counts = uf_counts[uf_counts > 0]
+    grafico_geografico(uf_counts, len(df), pdf, png)
+    return {'UF': uf_counts}
 
-def analise_geografica(df):
-    """Análise da distribuição geográfica"""
+def grafico_geografico(uf_counts, total, pdf, png=False):
+    """Gera o gráfico dos estados com mais sugestões a partir da contagem por UF"""
     print("\n" + "="*50)
     print("🗺️ ANÁLISE GEOGRÁFICA")
     print("="*50)
     
-    df['UF'] = df['UF'].fillna('NÃO INFORMADO')
-    uf_distribuicao = df['UF'].value_counts().head(10)
+    uf_distribuicao = uf_counts.nlargest(10)
     
-    plt.figure(figsize=(12, 6))
+    ax = nova_figura(12, 6)
     colors = plt.cm.Set3(np.linspace(0, 1, len(uf_distribuicao)))
-    bars = plt.bar(uf_distribuicao.index, uf_distribuicao.values, color=colors)
+    bars = ax.bar(uf_distribuicao.index, uf_distribuicao.values, color=colors)
     
-    plt.title('TOP 10 ESTADOS COM MAIS SUGESTÕES', fontweight='bold', fontsize=14)
-    plt.xlabel('Estado', fontweight='bold')
-    plt.ylabel('Número de Sugestões', fontweight='bold')
+    ax.set_title('TOP 10 ESTADOS COM MAIS SUGESTÕES', fontweight='bold', fontsize=14)
+    ax.set_xlabel('Estado', fontweight='bold')
+    ax.set_ylabel('Número de Sugestões', fontweight='bold')
     
     # Adicionar valores nas barras
-    for bar in bars:
-        height = bar.get_height()
-        plt.text(bar.get_x() + bar.get_width()/2., height,
-                f'{int(height):,}', ha='center', va='bottom', fontweight='bold')
+    ax.bar_label(bars, labels=[f'{int(v):,}' for v in uf_distribuicao.values],
+                 fontweight='bold')
     
-    plt.grid(axis='y', alpha=0.3)
-    plt.tight_layout()
-    plt.savefig('distribuicao_geografica.png', dpi=300, bbox_inches='tight')
-    plt.show()
+    ax.grid(axis='y', alpha=0.3)
+    _FIG.tight_layout()
+    salvar_grafico(_FIG, 'distribuicao_geografica.png', pdf, png)
     
     print("\n🏆 TOP 5 ESTADOS MAIS ENGAGADOS:")
     for i, (estado, count) in enumerate(uf_distribuicao.head().items(), 1):
-        percentual = (count / len(df)) * 100
+        percentual = (count / total) * 100
         print(f"  {i}. {estado}: {count:,} sugestões ({percentual:.1f}%)")
 
-def analise_temporal(df):
+def analise_temporal(df, pdf, png=False):
     """Análise da evolução temporal"""
+    # Agrupar por mês
+    grafico_temporal(df['DATA'].dt.to_period('M').value_counts().sort_index(), pdf, png)
+
+def grafico_temporal(sugestoes_por_mes, pdf, png=False):
+    """Gera o gráfico da evolução mensal a partir da contagem por mês"""
     print("\n" + "="*50)
     print("📅 ANÁLISE TEMPORAL")
     print("="*50)
     
-    # Converter datas
-    df['DATA'] = pd.to_datetime(df['DATA'], dayfirst=True, errors='coerce')
-    
-    # Agrupar por mês
-    sugestoes_por_mes = df.groupby(df['DATA'].dt.to_period('M')).size()
+    meses = sugestoes_por_mes.index.astype(str)
     
-    plt.figure(figsize=(14, 6))
-    plt.plot(sugestoes_por_mes.index.astype(str), sugestoes_por_mes.values, 
-             marker='o', linewidth=2, markersize=6, color='#6A0572', alpha=0.8)
+    ax = nova_figura(14, 6)
+    ax.plot(meses, sugestoes_por_mes.values, 
+            marker='o', linewidth=2, markersize=6, color='#6A0572', alpha=0.8)
     
-    plt.title('EVOLUÇÃO TEMPORAL DAS SUGESTÕES', fontweight='bold', fontsize=14)
-    plt.xlabel('Mês/Ano', fontweight='bold')
-    plt.ylabel('Número de Sugestões', fontweight='bold')
-    plt.xticks(rotation=45)
-    plt.grid(True, alpha=0.3)
+    ax.set_title('EVOLUÇÃO TEMPORAL DAS SUGESTÕES', fontweight='bold', fontsize=14)
+    ax.set_xlabel('Mês/Ano', fontweight='bold')
+    ax.set_ylabel('Número de Sugestões', fontweight='bold')
+    ax.tick_params(axis='x', rotation=45)
+    ax.grid(True, alpha=0.3)
     
     # Destacar o pico
-    mes_pico = sugestoes_por_mes.idxmax()
-    valor_pico = sugestoes_por_mes.max()
-    pico_index = list(sugestoes_por_mes.index).index(mes_pico)
+    pico_index = int(sugestoes_por_mes.values.argmax())
+    valor_pico = int(sugestoes_por_mes.values[pico_index])
+    mes_pico = sugestoes_por_mes.index[pico_index]
     
-    plt.annotate(f'Pico: {valor_pico} sugestões', 
+    ax.annotate(f'Pico: {valor_pico} sugestões', 
                 xy=(pico_index, valor_pico), 
                 xytext=(pico_index, valor_pico + 10),
                 arrowprops=dict(arrowstyle='->', color='red'),
                 ha='center', fontweight='bold')
     
-    plt.tight_layout()
-    plt.savefig('evolucao_temporal.png', dpi=300, bbox_inches='tight')
-    plt.show()
+    _FIG.tight_layout()
+    salvar_grafico(_FIG, 'evolucao_temporal.png', pdf, png)
     
     print(f"📈 Mês com mais sugestões: {mes_pico} ({valor_pico} sugestões)")
 
-def analise_conteudo(df):
-    """Análise do conteúdo das sugestões"""
+def analise_conteudo(df, pdf, png=False, contagem_palavras=None):
+    """Análise do conteúdo das sugestões (aceita a contagem de palavras já pronta)"""
+    if contagem_palavras is None:
+        # Análise de palavras, texto a texto (sem juntar tudo numa única string)
+        # A coluna já é carregada como 'string', então não é preciso copiá-la com astype
+        contagem_palavras = contar_palavras(df['SUGESTAO.TEXTO'].dropna())
+    grafico_palavras(contagem_palavras, pdf, png)
+
+def grafico_palavras(contagem_palavras, pdf, png=False):
+    """Gera o gráfico das palavras mais frequentes a partir da contagem de palavras"""
     print("\n" + "="*50)
     print("📝 ANÁLISE DE CONTEÚDO")
     print("="*50)
     
-    # Juntar todos os textos
-    textos = df['SUGESTAO.TEXTO'].dropna().astype(str)
-    todos_textos = ' '.join(textos)
-    
-    # Análise de palavras
-    palavras = re.findall(r'\b[a-záéíóúâêîôûãõç]{4,}\b', todos_textos.lower())
+    # Seleção parcial das 15 mais frequentes, sem ordenar o vocabulário inteiro
+    contagem = contagem_palavras.nlargest(15)
+    top_palavras = list(contagem.items())
     
-    # Stop words em português
-    stop_words = {
-        'que', 'com', 'para', 'uma', 'mais', 'como', 'sobre', 'seus', 'este', 'esta',
-        'ser', 'seja', 'são', 'mas', 'muito', 'nosso', 'nossa', 'pelos', 'pelas',
-        'essa', 'esse', 'isso', 'aquele', 'aquela', 'entre', 'através', 'quando'
-    }
-    
-    palavras_filtradas = [p for p in palavras if p not in stop_words]
-    contagem = Counter(palavras_filtradas)
-    top_palavras = contagem.most_common(15)
-    
-    plt.figure(figsize=(12, 8))
+    ax = nova_figura(12, 8)
     palavras, frequencias = zip(*top_palavras)
     
-    bars = plt.barh(palavras, frequencias, color='#2E86AB', alpha=0.8)
-    plt.title('15 PALAVRAS MAIS FREQUENTES NAS SUGESTÕES', fontweight='bold', fontsize=14)
-    plt.xlabel('Frequência', fontweight='bold')
-    plt.gca().invert_yaxis()
+    bars = ax.barh(palavras, frequencias, color='#2E86AB', alpha=0.8)
+    ax.set_title('15 PALAVRAS MAIS FREQUENTES NAS SUGESTÕES', fontweight='bold', fontsize=14)
+    ax.set_xlabel('Frequência', fontweight='bold')
+    ax.invert_yaxis()
     
     # Adicionar valores
-    for bar in bars:
-        width = bar.get_width()
-        plt.text(width, bar.get_y() + bar.get_height()/2., 
-                f' {int(width)}', ha='left', va='center', fontweight='bold')
+    ax.bar_label(bars, fmt='%d', label_type='edge', padding=3, fontweight='bold')
     
-    plt.tight_layout()
-    plt.savefig('palavras_frequentes.png', dpi=300, bbox_inches='tight')
-    plt.show()
+    _FIG.tight_layout()
+    salvar_grafico(_FIG, 'palavras_frequentes.png', pdf, png)
     
     print("\n🔤 TOP 10 PALAVRAS-CHAVE:")
     for i, (palavra, freq) in enumerate(top_palavras[:10], 1):
         print(f"  {i}. {palavra.upper()}: {freq} ocorrências")
 
-def resumo_final(df):
-    """Gera um resumo final da análise"""
+def resumo_final(df, contagens=None, total_sugestoes=None, png=False):
+    """Gera um resumo final da análise, reaproveitando as contagens já calculadas"""
     print("\n" + "="*60)
     print("📊 RESUMO FINAL DA ANÁLISE")
     print("="*60)
     
     # Estatísticas principais
-    total_sugestoes = len(df)
-    participantes_masculinos = len(df[df['SEXO'] == 'MASCULINO'])
-    participantes_femininos = len(df[df['SEXO'] == 'FEMININO'])
-    
-    # Estado mais ativo
-    estado_mais_ativo = df['UF'].value_counts().index[0]
-    sugestoes_estado_mais_ativo = df['UF'].value_counts().iloc[0]
+    if total_sugestoes is None:
+        total_sugestoes = len(df)
+    contagens = dict(contagens or {})
+    if not all(coluna in contagens for coluna in COLUNAS_DEMOGRAFICAS):
+        contagens.update(contagens_demograficas(df))
+    if 'UF' not in contagens:
+        uf_counts = df['UF'].value_counts(sort=False)
+        contagens['UF'] = uf_counts[uf_counts > 0]
+    sexo_counts = contagens['SEXO']
+    participantes_masculinos = sexo_counts.get('MASCULINO', 0)
+    participantes_femininos = sexo_counts.get('FEMININO', 0)
+    
+    # Estado mais ativo (uma única contagem serve para nome e total)
+    uf_counts = contagens['UF']
+    pico_uf = int(uf_counts.values.argmax())
+    estado_mais_ativo = uf_counts.index[pico_uf]
+    sugestoes_estado_mais_ativo = int(uf_counts.values[pico_uf])
     
     # Faixa etária mais comum
-    faixa_mais_comum = df['FAIXA ETÁRIA'].value_counts().index[0]
+    faixa_mais_comum = contagens['FAIXA ETÁRIA'].idxmax()
     
     print(f"\n🎯 PRINCIPAIS ESTATÍSTICAS:")
     print(f"  • Total de sugestões analisadas: {total_sugestoes:,}")
@@ -272,35 +413,134 @@ def resumo_final(df):
     print(f"  • Faixa etária predominante: {faixa_mais_comum}")
     
     print(f"\n📈 GRÁFICOS GERADOS:")
-    print("  ✅ perfil_demografico.png")
-    print("  ✅ distribuicao_geografica.png") 
-    print("  ✅ evolucao_temporal.png")
-    print("  ✅ palavras_frequentes.png")
+    print(f"  ✅ {ARQUIVO_PDF} (todos os gráficos)")
+    if png:
+        print("  ✅ perfil_demografico.png")
+        print("  ✅ distribuicao_geografica.png") 
+        print("  ✅ evolucao_temporal.png")
+        print("  ✅ palavras_frequentes.png")
     
     print(f"\n💡 INSIGHTS INICIAIS:")
     print("  • [Seu insight 1 aqui]")
     print("  • [Seu insight 2 aqui]")
     print("  • [Seu insight 3 aqui]")
 
+def somar_contagens(acumulado, contagem):
+    """Soma a contagem de um chunk ao total acumulado"""
+    # Índice comum (não categórico) para alinhar chunks com categorias diferentes
+    contagem.index = contagem.index.astype(object)
+    if acumulado is None:
+        return contagem
+    return acumulado.add(contagem, fill_value=0)
+
+def analise_streaming(caminho=ARQUIVO_CSV, tamanho_chunk=TAMANHO_CHUNK, png=False):
+    """Roda todas as análises lendo o CSV em partes, sem carregar o dataset inteiro"""
+    if not os.path.exists(caminho):
+        print(f"❌ Arquivo '{caminho}' não encontrado!")
+        return False
+    
+    opcoes_csv = dict(delimiter=';', encoding='latin-1', na_values=['NA', ''],
+                      usecols=COLUNAS_USADAS, dtype=TIPOS_COLUNAS,
+                      parse_dates=['DATA'], dayfirst=True)
+    
+    total = 0
+    missing = None
+    contagens = dict.fromkeys(COLUNAS_DEMOGRAFICAS + ['UF'])
+    sugestoes_por_mes = None
+    contagem_palavras = None
+    
+    for chunk in pd.read_csv(caminho, chunksize=tamanho_chunk, **opcoes_csv):
+        if not pd.api.types.is_datetime64_any_dtype(chunk['DATA']):
+            chunk['DATA'] = pd.to_datetime(chunk['DATA'], dayfirst=True, errors='coerce')
+        
+        total += len(chunk)
+        missing = somar_contagens(missing, chunk.isnull().sum())
+        chunk = preparar(chunk)
+        for coluna in contagens:
+            contagens[coluna] = somar_contagens(contagens[coluna],
+                                                chunk[coluna].value_counts(sort=False))
+        
+        sugestoes_por_mes = somar_contagens(sugestoes_por_mes,
+                                            chunk['DATA'].dt.to_period('M').value_counts(sort=False))
+        contagem_palavras = somar_contagens(contagem_palavras,
+                                            contar_palavras(chunk['SUGESTAO.TEXTO'].dropna()))
+    
+    if total == 0:
+        print("❌ O arquivo não tem registros.")
+        return False
+    
+    # Somas com fill_value viram float; volta para inteiros
+    for coluna, contagem in contagens.items():
+        contagem = contagem.astype('int64')
+        if coluna == 'FAIXA ETÁRIA':
+            contagens[coluna] = contagem.reindex(ordem_faixas(contagem.index), fill_value=0)
+        else:
+            contagens[coluna] = contagem[contagem > 0]
+    
+    print(f"✅ Dataset processado em partes de {tamanho_chunk:,} linhas")
+    print(f"📊 Total de registros: {total:,}")
+    
+    # Apenas as primeiras linhas são lidas para a amostra
+    amostra = pd.read_csv(caminho, nrows=5, **opcoes_csv)
+    relatorio_preliminar(amostra, missing.astype('int64'), total)
+    with PdfPages(ARQUIVO_PDF) as pdf:
+        grafico_demografico(contagens, total, pdf, png)
+        grafico_geografico(contagens['UF'], total, pdf, png)
+        grafico_temporal(sugestoes_por_mes.astype('int64').sort_index(), pdf, png)
+        grafico_palavras(contagem_palavras.astype('int64'), pdf, png)
+    resumo_final(None, contagens, total, png)
+    return True
+
+def executar_analises(df, pdf, png, obter_contagem_palavras):
+    """Executa as análises na ordem do relatório e devolve as contagens reaproveitáveis"""
+    contagens = analise_demografica(df, pdf, png)
+    contagens.update(analise_geografica(df, pdf, png))
+    analise_temporal(df, pdf, png)
+    # A contagem de palavras só é necessária (e aguardada) no fim
+    analise_conteudo(df, pdf, png, obter_contagem_palavras())
+    return contagens
+
 # EXECUÇÃO PRINCIPAL
 if __name__ == "__main__":
+    print("🚀 INICIANDO ANÁLISE DOS DADOS DA CONSTITUINTE...\n")
     print("🔍 ANALISANDO DADOS DA CONSTITUINTE DE 1986")
     print("="*50)
     
+    # --png: grava também cada gráfico em PNG, além do PDF
+    png = '--png' in sys.argv
+    
+    # Modo --streaming: agrega o CSV em partes, para arquivos grandes demais para a memória
+    if '--streaming' in sys.argv:
+        if analise_streaming(png=png):
+            print("\n🎉 ANÁLISE CONCLUÍDA COM SUCESSO!")
+            print(f"📁 Os gráficos foram salvos em '{ARQUIVO_PDF}'")
+        else:
+            print("❌ Não foi possível processar os dados. Verifique o arquivo CSV.")
+        sys.exit()
+    
     # Carregar dados
     df = carregar_dados()
     
     if df is not None:
-        # Executar análises
+        # O relatório preliminar mostra os dados como vieram, antes do preenchimento
         analise_preliminar(df)
-        analise_demografica(df)
-        analise_geografica(df)
-        analise_temporal(df)
-        analise_conteudo(df)
-        resumo_final(df)
+        df = preparar(df)
+        
+        # Só a contagem de palavras (a etapa mais pesada) vai para outro processo,
+        # recebendo apenas a coluna de texto; as demais análises rodam aqui enquanto isso.
+        # Com um único núcleo tudo roda em sequência, sem criar processos.
+        textos = df['SUGESTAO.TEXTO'].dropna()
+        with PdfPages(ARQUIVO_PDF) as pdf:
+            if (os.cpu_count() or 1) > 1:
+                with ProcessPoolExecutor(max_workers=1) as executor:
+                    futuro_palavras = executor.submit(contar_palavras, textos)
+                    contagens = executar_analises(df, pdf, png, futuro_palavras.result)
+            else:
+                contagens = executar_analises(df, pdf, png, lambda: contar_palavras(textos))
+        resumo_final(df, contagens, png=png)
         
         print("\n🎉 ANÁLISE CONCLUÍDA COM SUCESSO!")
-        print("📁 Os gráficos foram salvos como arquivos PNG")
+        print(f"📁 Os gráficos foram salvos em '{ARQUIVO_PDF}'")
         
     else:
         print("❌ Não foi possível carregar os dados. Verifique o arquivo CSV.")